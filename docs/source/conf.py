@@ -14,7 +14,7 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath('/Users/RJMurray/Documents/Research/software/sageopt'))
 
-import inspect
+import types
 import sageopt
 
 
@@ -44,25 +44,26 @@ autodoc_default_options = {
 }
 
 
+_SKIPPED_MEMBER_NAMES = frozenset(['__weakref__',  # special-members
+                                   '__doc__', '__module__', '__dict__',  # undoc-members
+                                   ])
+
+_SKIPPED_FUNCTIONS = frozenset([
+    # exclusions for Variable objects
+    'Variable.is_constant', 'Variable.is_affine',
+    'Expression.as_expr',
+    # exclusions for PrimalSageCone objects
+    'PrimalSageCone.variables', 'PrimalSageCone.conic_form',
+    # exclusions for DualSageCone objects
+    'DualSageCone.variables', 'DualSageCone.conic_form',
+])
+
+
 def autodoc_skip_member(app, what, name, obj, skip, options):
-    exclusions = ('__weakref__',  # special-members
-                  '__doc__', '__module__', '__dict__',  # undoc-members
-                  )
-    if inspect.ismethod(obj) or inspect.isfunction(obj):
-        func_name = obj.__qualname__
-        # exclusions for Variable objects
-        if func_name in {'Variable.is_constant', 'Variable.is_affine'}:
-            return True
-        if func_name in {'Expression.as_expr'}:
+    if isinstance(obj, (types.MethodType, types.FunctionType)):
+        if obj.__qualname__ in _SKIPPED_FUNCTIONS:
             return True
-        # exclusions for PrimalSageCone objects
-        if func_name in {'PrimalSageCone.variables', 'PrimalSageCone.conic_form'}:
-            return True
-        # exclusions for DualSageCone objects
-        if func_name in {'DualSageCone.variables', 'DualSageCone.conic_form'}:
-            return True
-
-    exclude = name in exclusions
+    exclude = name in _SKIPPED_MEMBER_NAMES
     return skip or exclude
 
 
@@ -15,6 +15,7 @@
 """
 import numpy as np
 from collections import defaultdict
+from functools import lru_cache
 
 
 def build_cone_type_selectors(K):
@@ -53,3 +54,12 @@ class Cone(object):
             return self.type == other.type and self.len == other.len and self.annotations == other.annotations
         else:  # pragma: no cover
             return False
+
+
+@lru_cache(maxsize=4096)
+def shared_cone(cone_type, length):
+    """
+    Return a Cone of the given type and length, with no annotations. Repeated calls with
+    the same arguments return the same object, so the result must be treated as immutable.
+    """
+    return Cone(cone_type, length)
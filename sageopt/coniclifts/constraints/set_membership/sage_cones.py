@@ -17,7 +17,7 @@ import numpy as np
 from sageopt.coniclifts.constraints.set_membership.setmem import SetMembership
 from sageopt.coniclifts.constraints.set_membership.product_cone import PrimalProductCone, DualProductCone
 from sageopt.coniclifts.base import Variable, Expression
-from sageopt.coniclifts.cones import Cone
+from sageopt.coniclifts.cones import shared_cone
 from sageopt.coniclifts.operators import affine as aff
 from sageopt.coniclifts.operators.pos import pos as pos_operator
 from sageopt.coniclifts.operators.norms import vector2norm
@@ -32,9 +32,10 @@ from sageopt.coniclifts.standards.constants import (
 from sageopt.coniclifts.utilities import kernel_basis
 import warnings
 import scipy.special as special_functions
+import scipy.sparse as sp
 
 
-_ALLOWED_CONES_ = {'+', 'S', 'e', '0'}
+_ALLOWED_CONES_ = frozenset({'+', 'S', 'e', '0'})
 
 
 SETTINGS = {
@@ -48,11 +49,42 @@ SETTINGS = {
 
 
 def check_cones(K):
-    if any([co.type not in _ALLOWED_CONES_ for co in K]):
+    if not all(co.type in _ALLOWED_CONES_ for co in K):
         raise NotImplementedError()
     pass
 
 
+def _trivial_age_cone_certificate(mat, tol=1e-8):
+    """
+    Try to decide, without calling a solver, whether there exists an ``x`` with ``mat @ x < 0``.
+
+    Return True if such an ``x`` was found, False if ``mat`` has a zero row (so no such
+    ``x`` exists), and None if neither case could be established cheaply.
+    """
+    if np.any(np.all(mat == 0, axis=1)):
+        return False
+    scale = tol * np.max(np.abs(mat))
+    candidates = [-np.mean(mat, axis=0),
+                  np.linalg.lstsq(mat, -np.ones(mat.shape[0]), rcond=None)[0]]
+    for x in candidates:
+        if np.max(mat @ x) < -scale * np.linalg.norm(x, ord=1):
+            return True
+    return None
+
+
+def _conic_matrix(A, max_density=0.5):
+    """
+    Return ``A`` as a CSR matrix if at most ``max_density`` of its entries are nonzero,
+    and as a dense ndarray otherwise.
+    """
+    nnz = A.nnz if sp.issparse(A) else np.count_nonzero(A)
+    if nnz <= max_density * A.shape[0] * A.shape[1]:
+        return sp.csr_matrix(A)
+    elif sp.issparse(A):
+        return A.toarray()
+    return A
+
+
 class PrimalSageCone(SetMembership):
     """
     Require that :math:`f(x) = \\sum_{i=1}^m c_i \\exp(\\alpha_i \\cdot x)` is nonnegative on
@@ -196,11 +228,16 @@ class PrimalSageCone(SetMembership):
         if X is not None:
             check_cones(X.K)
             self._lifted_n = X.A.shape[1]
+            neg_A = -_conic_matrix(X.A)
+            self._neg_A_T = neg_A.T if sp.issparse(neg_A) else np.ascontiguousarray(neg_A.T)
+            # ^ shared across AGE cones; must not be modified.
             self.ech = ExpCoverHelper(self.alpha, self.c, (X.A, X.b, X.K), covers, self.settings)
         else:
             self._lifted_n = self._n
+            self._neg_A_T = None
             self.ech = ExpCoverHelper(self.alpha, self.c, None, covers, self.settings)
         self.age_vectors = dict()
+        self._age_matrix = None  # if self._m > 1, then rows are the values of self.age_vectors.
         self._sfx = None  # "suppfunc x"; for evaluating support function
         self._age_witnesses = None
         self._nus = dict()
@@ -209,6 +246,7 @@ class PrimalSageCone(SetMembership):
         self._c_vars = dict()
         self._relent_epi_vars = dict()
         self._eta_vars = dict()
+        self._scaled_age_covers = dict()  # e * age_vectors[i][expcover_idx[i]], for relent constraints.
         self._variables = self.c.variables()
         if self._m > 1 and self.X is None:
             self._ordsage_init_variables()
@@ -243,8 +281,7 @@ class PrimalSageCone(SetMembership):
                 var_name = 'nu^{(' + str(i) + ')}_' + self.name
                 if self.settings['kernel_basis']:
                     var_name = '_pre_' + var_name
-                    idx_set = self.ech.expcovers[i]
-                    mat = (self.alpha[idx_set, :] - self.alpha[i, :]).T
+                    mat = self.ech.alpha_diff(i).T
                     nu_i_basis = kernel_basis(mat)
                     self._nu_bases[i] = nu_i_basis
                     pre_nu_i = Variable(shape=(nu_i_basis.shape[1],), name=var_name)
@@ -282,15 +319,19 @@ class PrimalSageCone(SetMembership):
 
     def _build_aligned_age_vectors(self):
         if self._m > 1:
-            for i in self.ech.U_I:
-                ci_expr = Expression(np.zeros(self._m,))
+            self._age_matrix = Expression(np.zeros(shape=(len(self.ech.U_I), self._m)))
+            for k, i in enumerate(self.ech.U_I):
+                ci_expr = self._age_matrix[k, :]  # a view; assignments below fill in _age_matrix.
                 if i in self.ech.N_I:
-                    ci_expr[self.ech.expcovers[i]] = self._c_vars[i]
+                    cover_vars = self._c_vars[i]
                     ci_expr[i] = self.c[i]
                 else:
-                    ci_expr[self.ech.expcovers[i]] = self._c_vars[i][:-1]
+                    cover_vars = self._c_vars[i][:-1]
                     ci_expr[i] = self._c_vars[i][-1]
+                ci_expr[self.ech.expcover_idx[i]] = cover_vars
                 self.age_vectors[i] = ci_expr
+                if i in self._nus:
+                    self._scaled_age_covers[i] = np.e * cover_vars
         else:
             self.age_vectors[0] = self.c
         pass
@@ -298,13 +339,22 @@ class PrimalSageCone(SetMembership):
     def _age_vectors_sum_to_c(self):
         nonconst_locs = np.ones(self._m, dtype=bool)
         nonconst_locs[self.ech.N_I] = False
-        aux_c_vars = list(self.age_vectors.values())
-        aux_c_vars = aff.vstack(aux_c_vars).T
-        aux_c_vars = aux_c_vars[nonconst_locs, :]
+        # Read off the (location, variable id) pairs for the nonzero entries of the AGE
+        # vectors directly; this mirrors the assignments in _build_aligned_age_vectors.
+        locs, var_ids = [], []
+        for i in self.ech.U_I:
+            locs.append(self.ech.expcover_idx[i])
+            if i not in self.ech.N_I:
+                locs.append(np.array([i]))
+            var_ids.append(self._c_vars[i].scalar_variable_ids)
+        locs = np.concatenate(locs)
+        var_ids = np.concatenate(var_ids)
+        keep = nonconst_locs[locs]
+        rows = (np.cumsum(nonconst_locs) - 1)[locs[keep]]
         main_c_var = self.c[nonconst_locs]
-        A_vals, A_rows, A_cols, b = comp_aff.columns_sum_leq_vec(aux_c_vars, main_c_var)
+        A_vals, A_rows, A_cols, b = comp_aff.vars_sum_leq_vec(rows, var_ids[keep], main_c_var)
         conetype = '0' if self.settings['sum_age_force_equality'] else '+'
-        K = [Cone(conetype, b.size)]
+        K = [shared_cone(conetype, b.size)]
         return A_vals, A_rows, A_cols, b, K
 
     def variables(self):
@@ -320,6 +370,43 @@ class PrimalSageCone(SetMembership):
                 cd = self._condsage_conic_form()
         return cd
 
+    def compile(self):
+        """
+        Compile this constraint once, and return a function ``rebuild(var_ids)`` which produces
+        conic data for a constraint with the same structure over different variables.
+
+        The argument ``var_ids`` must list the ScalarVariable ids of another constraint's
+        ``variables()``, in order. ``rebuild(var_ids)`` returns what ``conic_form()`` would return
+        if the i-th ScalarVariable of ``self.variables()`` were replaced by the one with id
+        ``var_ids[i]``. This is useful for repeated PrimalSageCone constructions which share
+        ``alpha``, ``X``, covers, and the coefficients in ``c``.
+        """
+        cone_data = self.conic_form()
+        old_ids = [vid for v in self.variables() for vid in v.scalar_variable_ids]
+        id2pos = {vid: k for k, vid in enumerate(old_ids)}
+        template = []
+        for av, ar, ac, b, K in cone_data:
+            # Columns which don't belong to self.variables() (e.g. the placeholder columns
+            # emitted when c is constant) are passed through unchanged; they are marked by -1.
+            fixed = np.array(ac, dtype=int)
+            pos = np.array([id2pos.get(vid, -1) for vid in ac], dtype=int)
+            template.append((np.array(av, dtype=float), np.asarray(ar), fixed, pos, pos >= 0, b, K))
+        num_ids = len(old_ids)
+
+        def rebuild(var_ids):
+            var_ids = np.asarray(var_ids, dtype=int)
+            if var_ids.size != num_ids:
+                msg = 'Expected ' + str(num_ids) + ' ScalarVariable ids, received ' + str(var_ids.size) + '.'
+                raise ValueError(msg)
+            data = []
+            for (av, ar, fixed, pos, mask, b, K) in template:
+                ac = fixed.copy()
+                ac[mask] = var_ids[pos[mask]]
+                data.append((av.tolist(), ar.copy(), ac.tolist(), b.copy(), K))
+            return data
+
+        return rebuild
+
     def _trivial_conic_form(self):
         con = self.c >= 0
         con.epigraph_checked = True
@@ -332,21 +419,20 @@ class PrimalSageCone(SetMembership):
         nu_keys = self._nus.keys()
         for i in self.ech.U_I:
             if i in nu_keys:
-                idx_set = self.ech.expcovers[i]
                 # relative entropy inequality constraint
                 x = self._nus[i]
-                y = np.exp(1) * self.age_vectors[i][idx_set]  # This line consumes a large amount of runtime
+                y = self._scaled_age_covers[i]
                 z = -self.age_vectors[i][i]
                 epi = self._relent_epi_vars[i]
                 cd = sum_relent(x, y, z, epi)
                 cone_data.append(cd)
                 if not self.settings['kernel_basis']:
                     # linear equality constraints
-                    mat = (self.alpha[idx_set, :] - self.alpha[i, :]).T
+                    mat = self.ech.alpha_diff(i).T
                     av, ar, ac, _ = comp_aff.matvec(mat, self._nus[i])
                     num_rows = mat.shape[0]
                     curr_b = np.zeros(num_rows, )
-                    curr_k = [Cone('0', num_rows)]
+                    curr_k = [shared_cone('0', num_rows)]
                     cone_data.append((av, ar, ac, curr_b, curr_k))
             else:
                 con = 0 <= self.age_vectors[i][i]
@@ -358,33 +444,28 @@ class PrimalSageCone(SetMembership):
 
     def _condsage_conic_form(self):
         cone_data = []
-        lifted_alpha = self.alpha
-        if self._lifted_n > self._n:
-            zero_block = np.zeros(shape=(self._m, self._lifted_n - self._n))
-            lifted_alpha = np.hstack((lifted_alpha, zero_block))
+        eta_cone_data = self._eta_domain_conic_data()
         for i in self.ech.U_I:
             if i in self._nus:
-                idx_set = self.ech.expcovers[i]
                 # relative entropy inequality constraint
                 x = self._nus[i]
-                y = np.exp(1) * self.age_vectors[i][idx_set]  # takes weirdly long amount of time.
+                y = self._scaled_age_covers[i]
                 z = -self.age_vectors[i][i] + self._eta_vars[i] @ self.X.b
                 epi = self._relent_epi_vars[i]
                 cd = sum_relent(x, y, z, epi)
                 cone_data.append(cd)
                 # linear equality constraints
-                mat1 = (lifted_alpha[idx_set, :] - lifted_alpha[i, :]).T
-                mat2 = -self.X.A.T
+                mat1 = self.ech.alpha_diff(i, lifted=True).T
+                mat2 = self._neg_A_T
                 var1 = self._nus[i]
                 var2 = self._eta_vars[i]
                 av, ar, ac, _ = comp_aff.matvec_plus_matvec(mat1, var1, mat2, var2)
                 num_rows = mat1.shape[0]
                 curr_b = np.zeros(num_rows, )
-                curr_k = [Cone('0', num_rows)]
+                curr_k = [shared_cone('0', num_rows)]
                 cone_data.append((av, ar, ac, curr_b, curr_k))
                 # domain for "eta"
-                con = DualProductCone(self._eta_vars[i], self.X.K)
-                cone_data.extend(con.conic_form())
+                cone_data.extend(eta_cone_data[i])
             else:
                 con = 0 <= self.age_vectors[i][i]
                 con.epigraph_checked = True
@@ -393,6 +474,23 @@ class PrimalSageCone(SetMembership):
         cone_data.append(self._age_vectors_sum_to_c())
         return cone_data
 
+    def _eta_domain_conic_data(self):
+        # The constraints "self._eta_vars[i] in K^dagger" only differ in which
+        # variables they involve. Compile one of them, then relabel its columns.
+        if len(self._eta_vars) == 0:
+            return dict()
+        i0 = next(iter(self._eta_vars))
+        template = DualProductCone(self._eta_vars[i0], self.X.K).conic_form()
+        id2pos = {vid: k for k, vid in enumerate(self._eta_vars[i0].scalar_variable_ids)}
+        template = [(av, ar, np.array([id2pos[vid] for vid in ac], dtype=int), b, K)
+                    for (av, ar, ac, b, K) in template]
+        eta_cone_data = dict()
+        for i, eta in self._eta_vars.items():
+            eta_ids = np.array(eta.scalar_variable_ids)
+            eta_cone_data[i] = [(list(av), ar.copy(), eta_ids[pos].tolist(), b.copy(), K)
+                                for (av, ar, pos, b, K) in template]
+        return eta_cone_data
+
     @staticmethod
     def project(item, alpha, X):
         if np.all(item >= 0):
@@ -434,43 +532,21 @@ class PrimalSageCone(SetMembership):
         """
         c = self.c.value
         if self._m == 1:
-            residual = c.reshape((-1,))  # >= 0
-            residual[residual >= 0] = 0
-            return np.linalg.norm(c, ord=norm_ord)
+            residual = np.minimum(c.reshape((-1,)), 0)  # want c >= 0
+            return np.linalg.norm(residual, ord=norm_ord)
         if not rough:
             dist = PrimalSageCone.project(c, self.alpha, self.X)
             return dist
         # compute violation for "AGE vectors sum to c"
         #   Although, we can use the fact that the SAGE cone contains R^m_++.
         #   and so only compute violation for "AGE vectors sum to <= c"
-        age_vectors = {i: v.value for i, v in self.age_vectors.items()}
-        sum_age_vectors = sum(age_vectors.values())
+        age_matrix = self._age_matrix.value
+        sum_age_vectors = np.sum(age_matrix, axis=0)
         residual = c - sum_age_vectors  # want >= 0
-        residual[residual > 0] = 0
+        np.minimum(residual, 0, out=residual)
         sum_to_c_viol = np.linalg.norm(residual, ord=norm_ord)
         # compute violations for each AGE cone
-        alpha = self.alpha
-        if self._lifted_n > self._n:
-            # Then need to zero-pad alpha
-            zero_block = np.zeros(shape=(self._m, self._lifted_n - self._n))
-            alpha = np.hstack((alpha, zero_block))
-        age_viols = []
-        nu_keys = self._nus.keys()
-        for i in self.ech.U_I:
-            if i in nu_keys:
-                c_i = self.age_vectors[i].value
-                x_i = self._nus[i].value
-                x_i[x_i < 0] = 0
-                idx_set = self.ech.expcovers[i]
-                sf_part = self.sigma_x((alpha[i, :] - alpha[idx_set, :]).T @ x_i)
-                y_i = np.exp(1) * c_i[idx_set]
-                relent_res = np.sum(special_functions.rel_entr(x_i, y_i)) - c_i[i] + sf_part  # <= 0
-                relent_viol = 0 if relent_res < 0 else relent_res
-                age_viols.append(relent_viol)
-            else:
-                c_i = float(self._c_vars[i].value)
-                relent_viol = 0 if c_i >= 0 else -c_i
-                age_viols.append(relent_viol)
+        age_viols = [self._age_violation(i, age_matrix[k, :]) for k, i in enumerate(self.ech.U_I)]
         age_viols = np.array(age_viols)
         # add the max "AGE violation" to the violation for "AGE vectors sum to c".
         if np.any(age_viols == np.inf):
@@ -480,6 +556,22 @@ class PrimalSageCone(SetMembership):
             total_viol = sum_to_c_viol + np.max(age_viols)
         return total_viol
 
+    def _age_violation(self, i, c_i):
+        if i in self._nus:
+            x_i = self._nus[i].value
+            x_i[x_i < 0] = 0
+            idx_set = self.ech.expcover_idx[i]
+            y_i = np.zeros(self._lifted_n)
+            y_i[:self._n] = -(self.ech.alpha_diff(i).T @ x_i)
+            sf_part = self.sigma_x(y_i)
+            y_i = np.e * c_i[idx_set]
+            relent_res = np.sum(special_functions.rel_entr(x_i, y_i)) - c_i[i] + sf_part  # <= 0
+            relent_viol = 0 if relent_res < 0 else relent_res
+        else:
+            c_i = float(self._c_vars[i].value)
+            relent_viol = 0 if c_i >= 0 else -c_i
+        return relent_viol
+
     def sigma_x(self, y, tol=1e-8):
         """
         If :math:`X = \\mathbb{R}^n`, then return :math:`\\infty` when :math:`\\|y\\|_2 > \\texttt{tol}`
@@ -512,8 +604,8 @@ class PrimalSageCone(SetMembership):
                     num_cover = self.ech.expcover_counts[i]
                     if num_cover > 0:
                         x_i = self._nus[i]
-                        wi_expr[self.ech.expcovers[i]] = pos_operator(x_i, eval_only=True)
-                        wi_expr[i] = -aff.sum(wi_expr[self.ech.expcovers[i]])
+                        wi_expr[self.ech.expcover_idx[i]] = pos_operator(x_i, eval_only=True)
+                        wi_expr[i] = -aff.sum(wi_expr[self.ech.expcover_idx[i]])
                     self._age_witnesses[i] = wi_expr
             else:
                 self.age_vectors[0] = self.c
@@ -618,9 +710,11 @@ class DualSageCone(SetMembership):
         if X is not None:
             check_cones(X.K)
             self._lifted_n = X.A.shape[1]
+            self._A = _conic_matrix(X.A)
             self.ech = ExpCoverHelper(self.alpha, self.c, (X.A, X.b, X.K), covers, self.settings)
         else:
             self._lifted_n = self._n
+            self._A = None
             self.ech = ExpCoverHelper(self.alpha, self.c, None, covers, self.settings)
         self.X = X
         self.mu_vars = dict()
@@ -651,19 +745,18 @@ class DualSageCone(SetMembership):
 
     def conic_form(self):
         if self._m > 1:
-            nontrivial_I = list(set(self.ech.U_I + self.ech.P_I))
-            con = self.v[nontrivial_I] >= 0
+            con = self.v[self.ech.nontrivial_I] >= 0
             # TODO: figure out when above constraint is implied by exponential cone constraints.
             con.epigraph_checked = True
             cd = con.conic_form()
             cone_data = [cd]
             for i in self.ech.U_I:
-                idx_set = self.ech.expcovers[i]
+                idx_set = self.ech.expcover_idx[i]
                 num_cover = self.ech.expcover_counts[i]
                 if num_cover == 0:
                     continue
-                expr = np.tile(self.v[i], num_cover).view(Expression)
-                mat = self.alpha[i, :] - self.alpha[idx_set, :]
+                expr = self.v[i]  # broadcast by elementwise_relent
+                mat = -self.ech.alpha_diff(i)
                 vecvar = self._lifted_mu_vars[i][:self._n]
                 if self.settings['compact_dual']:
                     epi = mat @ vecvar
@@ -678,11 +771,11 @@ class DualSageCone(SetMembership):
                     av, ar, ac, _ = comp_aff.matvec_minus_vec(mat, vecvar, epi)
                     num_rows = mat.shape[0]
                     curr_b = np.zeros(num_rows)
-                    curr_k = [Cone('+', num_rows)]
+                    curr_k = [shared_cone('+', num_rows)]
                     cone_data.append((av, ar, ac, curr_b, curr_k))
                 # membership in cone induced by self.AbK
                 if self.X is not None:
-                    A, b, K = self.X.A, self.X.b, self.X.K
+                    A, b, K = self._A, self.X.b, self.X.K
                     vecvar = self._lifted_mu_vars[i]
                     singlevar = self.v[i]
                     av, ar, ac, curr_b = comp_aff.matvec_plus_vec_times_scalar(A, vecvar, b, singlevar)
@@ -720,41 +813,40 @@ class DualSageCone(SetMembership):
         re-solves for all auxiliary variables used by this constraint.
         """
         v = self.v.value
-        viols = []
-        for i in self.ech.U_I:
-            selector = self.ech.expcovers[i]
-            num_cover = self.ech.expcover_counts[i]
-            if num_cover > 0:
-                expr1 = np.tile(v[i], num_cover).ravel()
-                expr2 = v[selector].ravel()
-                lowerbounds = special_functions.rel_entr(expr1, expr2)
-                mat = -(self.alpha[selector, :] - self.alpha[i, :])
-                mu_i = self._lifted_mu_vars[i].value
-                # compute rough violation for this dual AGE cone
-                residual = mat @ mu_i[:self._n] - lowerbounds
-                residual[residual >= 0] = 0
-                curr_viol = np.linalg.norm(residual, ord=norm_ord)
-                if (self.X is not None) and (not np.isnan(curr_viol)):
-                    AbK_val = self.X.A @ mu_i + v[i] * self.X.b
-                    AbK_viol = PrimalProductCone.project(AbK_val, self.X.K)
-                    curr_viol += AbK_viol
-                # as applicable, solve an optimization problem to compute the violation.
-                if (curr_viol > 0 or np.isnan(curr_viol)) and not rough:
-                    temp_var = Variable(shape=(self._lifted_n,), name='temp_var')
-                    cons = [mat @ temp_var[:self._n] >= lowerbounds]
-                    if self.X is not None:
-                        con = PrimalProductCone(self.X.A @ temp_var + v[i] * self.X.b, self.X.K)
-                        cons.append(con)
-                    prob = Problem(CL_MIN, Expression([0]), cons)
-                    status, value = prob.solve(verbose=False)
-                    if status in {CL_SOLVED, CL_INACCURATE} and abs(value) < 1e-7:
-                        curr_viol = 0
-                viols.append(curr_viol)
-            else:
-                viols.append(0)
+        viols = [self._dual_age_violation(i, v, norm_ord, rough) for i in self.ech.U_I]
         viol = max(viols)
         return viol
 
+    def _dual_age_violation(self, i, v, norm_ord, rough):
+        selector = self.ech.expcover_idx[i]
+        num_cover = self.ech.expcover_counts[i]
+        if num_cover == 0:
+            return 0
+        v_i, v_sel = v[i], v[selector].ravel()
+        lowerbounds = special_functions.rel_entr(v_i, v_sel)
+        mat = -self.ech.alpha_diff(i)
+        mu_i = self._lifted_mu_vars[i].value
+        # compute rough violation for this dual AGE cone
+        residual = mat @ mu_i[:self._n] - lowerbounds
+        np.minimum(residual, 0, out=residual)
+        curr_viol = np.linalg.norm(residual, ord=norm_ord)
+        if (self.X is not None) and (not np.isnan(curr_viol)):
+            AbK_val = self.X.A @ mu_i + v[i] * self.X.b
+            AbK_viol = PrimalProductCone.project(AbK_val, self.X.K)
+            curr_viol += AbK_viol
+        # as applicable, solve an optimization problem to compute the violation.
+        if (curr_viol > 0 or np.isnan(curr_viol)) and not rough:
+            temp_var = Variable(shape=(self._lifted_n,), name='temp_var')
+            cons = [mat @ temp_var[:self._n] >= lowerbounds]
+            if self.X is not None:
+                con = PrimalProductCone(self.X.A @ temp_var + v[i] * self.X.b, self.X.K)
+                cons.append(con)
+            prob = Problem(CL_MIN, Expression([0]), cons)
+            status, value = prob.solve(verbose=False)
+            if status in {CL_SOLVED, CL_INACCURATE} and abs(value) < 1e-7:
+                curr_viol = 0
+        return curr_viol
+
 
 class ExpCoverHelper(object):
 
@@ -765,13 +857,9 @@ class ExpCoverHelper(object):
         if c is not None and not isinstance(c, Expression):
             raise RuntimeError()
         self.m = alpha.shape[0]
-        if AbK is not None:
-            lifted_n = AbK[0].shape[1]
-            n = alpha.shape[1]
-            if lifted_n > n:
-                # Then need to zero-pad alpha
-                zero_block = np.zeros(shape=(self.m, lifted_n - n))
-                alpha = np.hstack((alpha, zero_block))
+        self.n = alpha.shape[1]
+        self.lifted_n = AbK[0].shape[1] if AbK is not None else self.n
+        # ^ alpha is never zero-padded to the lifted dimension; see alpha_diff.
         self.alpha = alpha
         self.AbK = AbK
         self.c = c
@@ -793,6 +881,8 @@ class ExpCoverHelper(object):
             self.U_I = [i for i in range(self.m)]
             self.N_I = []
             self.P_I = []
+        self.nontrivial_I = np.array(sorted(set(self.U_I + self.P_I)), dtype=int)
+        # ^ sorted indices "i" where c[i] is not identically zero.
         if isinstance(expcovers, dict):
             self._verify_exp_covers(expcovers)
         elif expcovers is None:
@@ -800,8 +890,23 @@ class ExpCoverHelper(object):
         else:
             raise RuntimeError('Argument "expcovers" must be a dict.')
         self.expcovers = expcovers
-        expcover_counts = {i: np.count_nonzero(expcovers[i]) for i in self.U_I}
-        self.expcover_counts = expcover_counts
+        self.expcover_idx = {i: np.flatnonzero(expcovers[i]) for i in self.U_I}
+        # ^ integer-array versions of the boolean masks in expcovers.
+        self.expcover_counts = {i: self.expcover_idx[i].size for i in self.U_I}
+        self._alpha_diffs = dict()
+
+    def alpha_diff(self, i, lifted=False):
+        """
+        Return ``alpha[expcover_idx[i], :] - alpha[i, :]``. If ``lifted`` is True, then the result
+        is zero-padded to have ``self.lifted_n`` columns. The unpadded result is cached, and so
+        callers must not modify the returned array.
+        """
+        if i not in self._alpha_diffs:
+            self._alpha_diffs[i] = self.alpha[self.expcover_idx[i], :] - self.alpha[i, :]
+        diff = self._alpha_diffs[i]
+        if lifted and self.lifted_n > self.n:
+            diff = np.hstack((diff, np.zeros(shape=(diff.shape[0], self.lifted_n - self.n))))
+        return diff
 
     def _verify_exp_covers(self, expcovers):
         for i in self.U_I:
@@ -815,82 +920,85 @@ class ExpCoverHelper(object):
         pass
 
     def _default_exp_covers(self):
-        expcovers = dict()
-        for i in self.U_I:
-            cov = np.ones(shape=(self.m,), dtype=bool)
-            cov[self.N_I] = False
-            cov[i] = False
-            expcovers[i] = cov
+        # Row k of "covers" is the cover for i = self.U_I[k].
+        U_I = np.array(self.U_I, dtype=int)
+        covers = np.ones(shape=(U_I.size, self.m), dtype=bool)
+        covers[:, self.N_I] = False
+        covers[np.arange(U_I.size), U_I] = False
         if self.AbK is None or self.settings['heuristic_reduction']:
             row_sums = np.sum(self.alpha, 1)
             if np.all(self.alpha >= 0) and np.min(row_sums) == 0:
                 # Then apply the reduction.
                 zero_loc = np.nonzero(row_sums == 0)[0][0]
-                for i in self.U_I:
-                    if i == zero_loc:
-                        continue
-                    curr_cover = expcovers[i]
-                    curr_row = self.alpha[i, :]
-                    for j in range(self.m):
-                        if curr_cover[j] and j != zero_loc and curr_row @ self.alpha[j, :] == 0:
-                            curr_cover[j] = False
-                            """
-                            The above operation is without loss of generality for ordinary SAGE
-                            constraints. For conditional SAGE constraints, the operation may or
-                            may-not be without loss of generality. As a basic check, the above
-                            operation is w.l.o.g. even for conditional SAGE constraints, as long
-                            as the "conditioning" satisfies the following property:
+                # zero_mask[i, j] == True iff alpha[i, :] @ alpha[j, :] == 0,
+                # i != zero_loc, and j != zero_loc.
+                zero_mask = (self.alpha @ self.alpha.T) == 0
+                zero_mask[:, zero_loc] = False
+                zero_mask[zero_loc, :] = False
+                covers &= ~zero_mask[U_I, :]
+                """
+                The above operation is without loss of generality for ordinary SAGE
+                constraints. For conditional SAGE constraints, the operation may or
+                may-not be without loss of generality. As a basic check, the above
+                operation is w.l.o.g. even for conditional SAGE constraints, as long
+                as the "conditioning" satisfies the following property:
 
-                                Suppose "y" a geometric-form solution which is feasible w.r.t.
-                                conditioning. Then "y" remains feasible (w.r.t. conditioning)
-                                when we assign "y[k] = 0".
+                    Suppose "y" a geometric-form solution which is feasible w.r.t.
+                    conditioning. Then "y" remains feasible (w.r.t. conditioning)
+                    when we assign "y[k] = 0".
 
-                            The comments below explain in greater detail.
+                The comments below explain in greater detail.
 
-                            Observation
-                            -----------
-                            By being in this part of the code, there must exist a "k" where
+                Observation
+                -----------
+                By being in this part of the code, there must exist a "k" where
 
-                                 alpha[i,k] == 0 and alpha[j,k] > 0.
+                     alpha[i,k] == 0 and alpha[j,k] > 0.
 
-                            Also, we have alpha >= 0. These facts tell us that the expression
+                Also, we have alpha >= 0. These facts tell us that the expression
 
-                                (alpha[j2,:] - alpha[i,:]) @ mu[:, i] (*)
+                    (alpha[j2,:] - alpha[i,:]) @ mu[:, i] (*)
 
-                            is (1) non-decreasing in mu[k,i] for all 0 <= j2 < m, and (2)
-                            strictly increasing in mu[k,i] when j2 == j. Therefore by
-                            sending mu[i,k] to -\infty, we do not increase (*) for any
-                            0 <= j2 < m, and in fact (*) goes to -\infty for j2 == j.
+                is (1) non-decreasing in mu[k,i] for all 0 <= j2 < m, and (2)
+                strictly increasing in mu[k,i] when j2 == j. Therefore by
+                sending mu[i,k] to -\infty, we do not increase (*) for any
+                0 <= j2 < m, and in fact (*) goes to -\infty for j2 == j.
 
-                            Consequence 1
-                            -------------
-                            If mu[:,i] is only subject to constraints of the form
+                Consequence 1
+                -------------
+                If mu[:,i] is only subject to constraints of the form
 
-                                v[i]*log(v[j2]/v[i]) >= (alpha[j2,:] - alpha[i,:]) @ mu[:, i]
+                    v[i]*log(v[j2]/v[i]) >= (alpha[j2,:] - alpha[i,:]) @ mu[:, i]
 
-                            with 0 <= j2 < m, then the particular constraint with j2 == j
-                            is never active at any optimal solution. For ordinary SAGE cones,
-                            this means the j-th term of alpha isn't used in the i-th AGE cone.
+                with 0 <= j2 < m, then the particular constraint with j2 == j
+                is never active at any optimal solution. For ordinary SAGE cones,
+                this means the j-th term of alpha isn't used in the i-th AGE cone.
 
-                            Consequence 2
-                            -------------
-                            For conditional SAGE cones, there is another constraint:
+                Consequence 2
+                -------------
+                For conditional SAGE cones, there is another constraint:
 
-                                 A @ mu[:, i] + v[i] * b \in K.      (**)
+                     A @ mu[:, i] + v[i] * b \in K.      (**)
 
-                            However, as long as (**) allows us to send mu[k,i] to -\infty
-                            without affecting feasibility, then the we arrive at the same
-                            conclusion: the j-th term of alpha isn't used in the i-th AGE cone.
-                            """
+                However, as long as (**) allows us to send mu[k,i] to -\infty
+                without affecting feasibility, then the we arrive at the same
+                conclusion: the j-th term of alpha isn't used in the i-th AGE cone.
+                """
         if self.AbK is None:
-            for i in self.U_I:
-                if np.count_nonzero(expcovers[i]) == 1:
-                    expcovers[i][:] = False
+            covers[np.count_nonzero(covers, axis=1) == 1, :] = False
+        expcovers = {i: covers[k, :].copy() for k, i in enumerate(self.U_I)}
         if self.settings['presolve_trivial_age_cones']:
+            # Presolve only ever clears the cover for the index under consideration.
+            nonempty = dict(zip(self.U_I, np.any(covers, axis=1)))
             if self.AbK is None:
                 for i in self.U_I:
-                    if np.any(expcovers[i]):
+                    if nonempty[i]:
                         mat = self.alpha[expcovers[i], :] - self.alpha[i, :]
+                        certificate = _trivial_age_cone_certificate(mat)
+                        if certificate is not None:
+                            if certificate:
+                                expcovers[i][:] = False
+                            continue
                         x = Variable(shape=(mat.shape[1],), name='temp_x')
                         objective = Expression([0])
                         cons = [mat @ x <= -1]
@@ -901,13 +1009,13 @@ class ExpCoverHelper(object):
                             expcovers[i][:] = False
             else:
                 for i in self.U_I:
-                    if np.any(expcovers[i]):
+                    if nonempty[i]:
                         mat = self.alpha[expcovers[i], :] - self.alpha[i, :]
-                        x = Variable(shape=(mat.shape[1],), name='temp_x')
+                        x = Variable(shape=(self.lifted_n,), name='temp_x')
                         t = Variable(shape=(1,), name='temp_t')
                         objective = t
                         A, b, K = self.AbK
-                        cons = [mat @ x <= t, PrimalProductCone(A @ x + b, K)]
+                        cons = [mat @ x[:self.n] <= t, PrimalProductCone(A @ x + b, K)]
                         prob = Problem(CL_MIN, objective, cons)
                         prob.solve(verbose=False,
                                    solver=self.settings['reduction_solver'])
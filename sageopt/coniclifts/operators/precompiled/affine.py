@@ -14,6 +14,7 @@
    limitations under the License.
 """
 import numpy as np
+import scipy.sparse as sp
 from sageopt.coniclifts.base import Variable, Expression, ScalarExpression
 from sageopt.coniclifts.operators.affine import concatenate
 
@@ -26,7 +27,7 @@ def matvec(mat, vec):
 
     Parameters
     ----------
-    mat : ndarray
+    mat : ndarray or scipy.sparse.spmatrix
         Shape (m, n)
     vec : Expression
         Shape (n,)
@@ -56,6 +57,13 @@ def matvec(mat, vec):
 
 
 def _matvec_by_var_indices(mat, var_ids):
+    if sp.issparse(mat):
+        # only emit the structural nonzeros of mat.
+        mat = mat.tocoo()
+        A_rows = mat.row
+        A_cols = np.asarray(var_ids)[mat.col].tolist()
+        A_vals = mat.data.tolist()
+        return A_vals, A_rows, A_cols
     A_rows = np.tile(np.arange(mat.shape[0]), reps=mat.shape[1])
     A_cols = np.repeat(var_ids, mat.shape[0]).tolist()
     A_vals = mat.ravel(order='F').tolist()  # stack columns, then tolist
@@ -75,7 +83,7 @@ def matvec_plus_matvec(mat1, vec1, mat2, vec2):
         expr = mat1 @ vecvar1 + mat2 @ vecvar2 would have "expr >= 0"
         compile to A_vals, A_rows, A_cols, np.zeros((m,)), [].
     """
-    mat = np.hstack([mat1, mat2])
+    mat = _hstack([mat1, mat2])
     if isinstance(vec1, Variable) and isinstance(vec2, Variable):
         num_rows = mat.shape[0]
         b = np.zeros(num_rows)
@@ -144,11 +152,11 @@ def matvec_plus_vec_times_scalar(mat1, vec1, vec2, scalar):
         s_covec = np.array([co for (sv, co) in a2c])
         s_indices = [sv.id for (sv, co) in a2c]
         mat2 = np.outer(vec2, s_covec)  # rank 1
-        mat = np.hstack((mat1, mat2))
+        mat = _hstack([mat1, mat2])
         indices = vec1.scalar_variable_ids + s_indices
         A_vals, A_rows, A_cols = _matvec_by_var_indices(mat, indices)
     else:
-        mat = np.hstack([mat1, np.reshape(vec2, (-1, 1))])
+        mat = _hstack([mat1, np.reshape(vec2, (-1, 1))])
         if isinstance(scalar, ScalarExpression):
             scalar = Expression([scalar])
         expr = concatenate((vec1, scalar))
@@ -156,27 +164,43 @@ def matvec_plus_vec_times_scalar(mat1, vec1, vec2, scalar):
     return A_vals, A_rows, A_cols, b
 
 
-def columns_sum_leq_vec(mat, vec):
-    A_rows, A_cols, A_vals = [], [], []
-    m = mat.shape[0]
-    if m != vec.size:
-        raise RuntimeError('Incompatible dimensions.')
+def _hstack(mats):
+    if any(sp.issparse(mat) for mat in mats):
+        return sp.hstack(mats, format='csr')
+    return np.hstack(mats)
+
+
+def vars_sum_leq_vec(rows, var_ids, vec):
+    """
+    Return sparse data for the constraint "y <= vec", where the vector "y" is given by
+    y[i] = sum(scalar variables with id var_ids[k] for k where rows[k] == i).
+
+    Parameters
+    ----------
+    rows : ndarray
+        Integer array, with entries in range(vec.size).
+    var_ids : ndarray
+        Integer array of ScalarVariable ids, with var_ids.size == rows.size.
+    vec : Expression
+        Shape (m,).
+
+    Returns
+    -------
+    A_vals : list
+    A_rows : ndarray
+    A_cols : list
+    b : ndarray of shape (m,)
+    """
+    A_rows = [np.asarray(rows)]
+    A_cols = np.asarray(var_ids).tolist()
+    A_vals = [-1] * len(A_cols)
+    m = vec.size
     b = np.zeros(m,)
     for i in range(m):
-        # update cols and data to reflect addition of elements in ith row of mat
-        svs = mat[i, :].scalar_variables()
-        A_cols += [sv.id for sv in svs]
-        A_vals += [-1] * len(svs)
-        # update cols and data to reflect addition of elements from ith element of vec
-        #   ith element of vec is a ScalarExpression!
         id2co = [(a.id, co) for a, co in vec[i].atoms_to_coeffs.items()]
         A_cols += [aid for aid, _ in id2co]
         A_vals += [co for _, co in id2co]
-        # update rows with appropriate number of "i"s.
-        A_rows += [i] * (len(svs) + len(id2co))
-        # update b
+        A_rows.append(np.full(len(id2co), i))
         b[i] = vec[i].offset
-    A_rows = np.array(A_rows)
+    A_rows = np.concatenate(A_rows).astype(int)
     return A_vals, A_rows, A_cols, b
-
-
@@ -15,7 +15,7 @@
 """
 import numpy as np
 from sageopt.coniclifts.base import Expression, Variable
-from sageopt.coniclifts.cones import Cone
+from sageopt.coniclifts.cones import shared_cone
 
 
 def sum_relent(x, y, z, aux_vars):
@@ -23,15 +23,17 @@ def sum_relent(x, y, z, aux_vars):
     # return the Variable object created for all epigraphs needed in
     # this process, as well as A_data, b, and K.
     x, y = _align_args(x, y)
+    if x.size != y.size:
+        raise RuntimeError('Illegal arguments to sum_relent.')
     if not isinstance(z, Expression):
         z = Expression(z)
     if z.size != 1 or not z.is_affine():
         raise RuntimeError('Illegal argument to sum_relent.')
     else:
         z = z.item()  # gets the single element
-    num_rows = 1 + 3 * x.size
+    num_rows = 1 + 3 * y.size
     b = np.zeros(num_rows,)
-    K = [Cone('+', 1)] + [Cone('e', 3) for _ in range(x.size)]
+    K = [shared_cone('+', 1)] + [shared_cone('e', 3)] * y.size
     A_rows, A_cols, A_vals = [], [], []
     # populate the first row
     z_id2co = [(a.id, co) for a, co in z.atoms_to_coeffs.items()]
@@ -53,6 +55,8 @@ def elementwise_relent(x, y, z):
     Return variables "z" and conic constraint data for the system
         x[i] * ln( x[i] / y[i] ) <= z[i]
 
+    If "x" has a single element, then it is broadcast against "y".
+
     A_vals - a list of floats,
     np.array(A_rows) - a numpy array of ints,
     A_cols - a list of ints,
@@ -60,9 +64,14 @@ def elementwise_relent(x, y, z):
     K - a list of coniclifts Cone objects (of type 'e'),
     """
     x, y = _align_args(x, y)
-    num_rows = 3 * x.size
+    if x.size == 1 and y.size > 1:
+        # broadcast by reference, rather than copying the ScalarExpression.
+        x = [x.item()] * y.size
+    elif x.size != y.size:
+        raise RuntimeError('Illegal arguments to elementwise_relent.')
+    num_rows = 3 * y.size
     b = np.zeros(num_rows,)
-    K = [Cone('e', 3) for _ in range(x.size)]
+    K = [shared_cone('e', 3)] * y.size
     A_rows, A_cols, A_vals = [], [], []
     curr_row = 0
     if isinstance(z, Variable):
@@ -76,7 +85,7 @@ def elementwise_relent(x, y, z):
 
 def _fast_elemwise_data(A_rows, A_cols, A_vals, b, x, y, aux_var_ids, curr_row):
     # aux_var_ids is a list of ScalarVariable ids for epigraph terms
-    for i in range(x.size):
+    for i in range(y.size):
         # first entry of exp cone
         A_rows.append(curr_row)
         A_cols.append(aux_var_ids[i])
@@ -99,7 +108,7 @@ def _fast_elemwise_data(A_rows, A_cols, A_vals, b, x, y, aux_var_ids, curr_row):
 def _compact_elemwise_data(A_rows, A_cols, A_vals, b, x, y, z, curr_row):
     # z can be any affine coniclifts Expression
     Azr, Azc, Azv = [], [], []  # Add the z's last, since we need to flip signs.
-    for i in range(x.size):
+    for i in range(y.size):
         # first entry of exp cone
         id2co = [(a.id, co) for a, co in z[i].atoms_to_coeffs.items()]
         ids, cos = zip(*id2co)
@@ -135,6 +144,4 @@ def _align_args(x, y):
         y = Expression(y)
     x = x.ravel()
     y = y.ravel()
-    if x.size != y.size:
-        raise RuntimeError('Illegal arguments to sum_relent.')
     return x, y
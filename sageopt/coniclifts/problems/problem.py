@@ -164,6 +164,7 @@ class Problem(object):
         self.variable_map = variable_map
         self.variable_values = dict()
         self.solver_apply_data = dict()
+        self._reusable_apply_data = dict()
         self.solver_raw_output = dict()
         self.status = None  # "solved", "inaccurate", or "failed"
         self.value = np.NaN
@@ -210,6 +211,9 @@ class Problem(object):
 
             max_iters : int. Maximum number of iterations for ECOS.
 
+            abstol, reltol, feastol : float. Absolute, relative, and feasibility tolerances
+            for ECOS. Each defaults to ECOS' own default (1e-8).
+
             mosek_params : dict. Following CVXPY parameter processing conventions. Also,
             allows options {``'NUM_THREADS'``: int, ``'CO_TOL_NEAR_REL'``: float,
             ``'TOL_PATH'``: float, ``'TOL_STEP_SIZE'``: float, ``'DEACTIVATE_SCALING':`` bool}.
@@ -241,14 +245,18 @@ class Problem(object):
         t0 = time.time()
         if self._integer_indices is not None:
             options['integers'] = True
-        data, inv_data = solver_object.apply(self.c, self.A, self.b, self.K, options)
+        if solver in self._reusable_apply_data:
+            data, inv_data = self._reusable_apply_data[solver]
+        else:
+            data, inv_data = solver_object.apply(self.c, self.A, self.b, self.K, options)
+            if self._integer_indices is None and not solver_object._APPLY_DEPENDS_ON_PARAMS_:
+                # The solver does not modify this data, so it can be used again if
+                # this problem is re-solved (e.g. with different solver parameters).
+                self._reusable_apply_data[solver] = (data, inv_data)
         self.timings[solver]['apply'] = time.time() - t0
         if self._integer_indices is not None:
             data['integer_indices'] = self._integer_indices.tolist()
         if options['cache_apply_data']:
-            # TODO: look into the possibility of always caching apply data,
-            #  and re-useing if the solver is called again (e.g. with different
-            #  parameters).
             self.solver_apply_data[solver] = (data, inv_data)
 
         # Solve the problem
@@ -24,6 +24,8 @@ import copy
 
 class ECOS(Solver):
 
+    _APPLY_DEPENDS_ON_PARAMS_ = False
+
     @staticmethod
     def apply(c, A, b, K, params):
         """
@@ -63,9 +65,10 @@ class ECOS(Solver):
             max_iters = params['max_iters']
         else:
             max_iters = 100000
+        tols = {k: params[k] for k in ('abstol', 'reltol', 'feastol') if k in params}
         sol = ecos.solve(data['c'], data['G'], data['h'], data['cones'], data['A'], data['b'],
                          verbose=params['verbose'],
-                         max_iters=max_iters)
+                         max_iters=max_iters, **tols)
         return sol
 
     # noinspection SpellCheckingInspection
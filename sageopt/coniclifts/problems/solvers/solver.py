@@ -20,6 +20,10 @@ class Solver(object):
     This is currently only an interface, and contains no executable code.
     """
 
+    # If False, then the output of ``apply`` is fully determined by (c, A, b, K), and
+    # may be reused across repeated calls to ``Problem.solve``.
+    _APPLY_DEPENDS_ON_PARAMS_ = True
+
     @staticmethod
     def apply(c, A, b, K, params):
         raise NotImplementedError()
@@ -50,8 +50,9 @@ def valid_posynomial_inequalities(gs):
             raise RuntimeError('Attempting to convexify an infeasible signomial inequality constraint.')
         else:
             pos_loc = np.where(g.c > 0)[0][0]
-            inverse_term = Signomial.from_dict({tuple(-g.alpha[pos_loc, :]): 1})
-            conv_gs.append(g * inverse_term)
+            # equivalent to multiplying g by the monomial exp(-alpha[pos_loc, :] @ x).
+            conv_g = Signomial(g.alpha - g.alpha[pos_loc, :], g.c).without_zeros()
+            conv_gs.append(conv_g)
     return conv_gs
 
 
@@ -97,6 +98,7 @@ def valid_gp_representable_poly_eqs(eqs):
 def clcons_from_standard_gprep(n, gts, eqs):
     x = cl.Variable(shape=(n,), name='temp_x')
     coniclift_cons = []
+    lin_rows, lin_rhs = [], []
     for g in gts:
         nonconst_selector = np.ones(shape=(g.m,), dtype=bool)
         nonconst_selector[g.constant_location()] = False
@@ -107,13 +109,20 @@ def clcons_from_standard_gprep(n, gts, eqs):
             expr = cl.weighted_sum_exp(c, alpha @ x)
             coniclift_cons.append(expr <= cst)
         elif g.m == 2:
-            expr = g.alpha[nonconst_selector, :] @ x
-            cst = np.log(g.c[~nonconst_selector] / abs(g.c[nonconst_selector]))
-            coniclift_cons.append(expr <= cst)
-    for g in eqs:
-        # g is of the form c1 - c2 * exp(a.T @ x) == 0, where c1, c2 > 0
-        cst_loc = g.constant_location()
-        non_cst_loc = 1 - cst_loc
-        rhs = np.log(g.c[cst_loc] / abs(g.c[non_cst_loc]))
-        coniclift_cons.append(g.alpha[non_cst_loc, :] @ x == rhs)
+            lin_rows.append(g.alpha[nonconst_selector, :])
+            lin_rhs.append(np.log(g.c[~nonconst_selector] / abs(g.c[nonconst_selector])))
+    if len(lin_rows) > 0:
+        # two-term inequalities are linear in x; stack them into a single constraint.
+        A = np.vstack(lin_rows)
+        b = np.concatenate(lin_rhs)
+        coniclift_cons.append(A @ x <= b)
+    if len(eqs) > 0:
+        # each g is of the form c1 - c2 * exp(a.T @ x) == 0, where c1, c2 > 0
+        cst_locs = np.array([g.constant_location() for g in eqs])
+        non_cst_locs = 1 - cst_locs
+        A = np.vstack([g.alpha[i, :] for g, i in zip(eqs, non_cst_locs)])
+        c1 = np.array([g.c[i] for g, i in zip(eqs, cst_locs)], dtype=float)
+        c2 = np.array([g.c[i] for g, i in zip(eqs, non_cst_locs)], dtype=float)
+        rhs = np.log(c1 / np.abs(c2))
+        coniclift_cons.append(A @ x == rhs)
     return coniclift_cons
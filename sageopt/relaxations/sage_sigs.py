@@ -265,14 +265,12 @@ def sig_constrained_relaxation(f, gts, eqs, X=None, form='dual', **kwargs):
     ell = kwargs['ell'] if 'ell' in kwargs else 0
     slacks = kwargs['slacks'] if 'slacks' in kwargs else False
 
-    if form.lower()[0] == 'd':
-        prob = sig_constrained_dual(f, gts, eqs, p, q, ell, X, slacks)
-    elif form.lower()[0] == 'p':
-        prob = sig_constrained_primal(f, gts, eqs, p, q, ell, X)
-    else:
+    if form.lower()[0] not in {'d', 'p'}:
         raise RuntimeError('Unrecognized form: ' + form + '.')
+    prebuilt = _prepare_constrained(f, gts, eqs, p, q, ell)
+    prob = _assemble_constrained(prebuilt, X, form, slacks)
+    cl.clear_variable_indices()
     return prob
-    pass
 
 
 def sig_constrained_primal(f, gts, eqs, p=0, q=1, ell=0, X=None):
@@ -285,28 +283,8 @@ def sig_constrained_primal(f, gts, eqs, p=0, q=1, ell=0, X=None):
 
     where X = :math:`R^{\\texttt{f.n}}` by default.
     """
-    lagrangian, ineq_lag_mults, _, gamma = make_sig_lagrangian(f, gts, eqs, p=p, q=q)
-    metadata = {'lagrangian': lagrangian, 'X': X}
-    if ell > 0:
-        alpha_E_1 = hierarchy_e_k([f, f.upcast_to_signomial(1)] + gts + eqs, k=1)
-        modulator = Signomial(alpha_E_1, np.ones(alpha_E_1.shape[0])) ** ell
-        lagrangian = lagrangian * modulator
-    else:
-        modulator = f.upcast_to_signomial(1)
-    metadata['modulator'] = modulator
-    # The Lagrangian (after possible multiplication, as above) must be a SAGE signomial.
-    con = primal_sage_cone(lagrangian, name='Lagrangian is SAGE', X=X)
-    constrs = [con]
-    #  Lagrange multipliers (for inequality constraints) must be SAGE signomials.
-    expcovers = None
-    for i, (s_h, _) in enumerate(ineq_lag_mults):
-        con_name = 'SAGE multiplier for signomial inequality # ' + str(i)
-        con = primal_sage_cone(s_h, name=con_name, X=X, expcovers=expcovers)
-        expcovers = con.ech.expcovers  # only * really * needed in first iteration, but keeps code flat.
-        constrs.append(con)
-    # Construct the coniclifts Problem.
-    prob = cl.Problem(cl.MAX, gamma, constrs)
-    prob.metadata = metadata
+    prebuilt = _prepare_constrained(f, gts, eqs, p, q, ell)
+    prob = _assemble_constrained_primal(prebuilt, X)
     cl.clear_variable_indices()
     return prob
 
@@ -321,23 +299,75 @@ def sig_constrained_dual(f, gts, eqs, p=0, q=1, ell=0, X=None, slacks=False):
 
     where X = :math:`R^{\\texttt{f.n}}` by default.
     """
-    lagrangian, ineq_lag_mults, eq_lag_mults, _ = make_sig_lagrangian(f, gts, eqs, p=p, q=q)
-    metadata = {'lagrangian': lagrangian, 'f': f, 'gts': gts, 'eqs': eqs, 'level': (p, q, ell), 'X': X}
+    prebuilt = _prepare_constrained(f, gts, eqs, p, q, ell)
+    prob = _assemble_constrained_dual(prebuilt, X, slacks)
+    cl.clear_variable_indices()
+    return prob
+
+
+def _prepare_constrained(f, gts, eqs, p, q, ell):
+    # The steps of a SAGE-(p, q, ell) relaxation which don't depend on the form (primal or dual)
+    # of the relaxation: forming the Lagrangian and the modulator, and multiplying the two.
+    # The result can be passed to _assemble_constrained more than once; callers should
+    # only call cl.clear_variable_indices() after the last such assembly.
+    lagrangian, ineq_lag_mults, eq_lag_mults, gamma = make_sig_lagrangian(f, gts, eqs, p=p, q=q)
     if ell > 0:
         alpha_E_1 = hierarchy_e_k([f, f.upcast_to_signomial(1)] + list(gts) + list(eqs), k=1)
         modulator = Signomial(alpha_E_1, np.ones(alpha_E_1.shape[0])) ** ell
-        lagrangian = lagrangian * modulator
-        f = f * modulator
+        modulated_lagrangian = lagrangian * modulator
     else:
         modulator = f.upcast_to_signomial(1)
-    metadata['modulator'] = modulator
+        modulated_lagrangian = lagrangian
+    prebuilt = {'f': f, 'gts': gts, 'eqs': eqs, 'level': (p, q, ell),
+                'lagrangian': lagrangian, 'modulated_lagrangian': modulated_lagrangian,
+                'modulator': modulator, 'ineq_lag_mults': ineq_lag_mults,
+                'eq_lag_mults': eq_lag_mults, 'gamma': gamma}
+    return prebuilt
+
+
+def _assemble_constrained(prebuilt, X, form, slacks=False):
+    if form.lower()[0] == 'd':
+        prob = _assemble_constrained_dual(prebuilt, X, slacks)
+    elif form.lower()[0] == 'p':
+        prob = _assemble_constrained_primal(prebuilt, X)
+    else:
+        raise RuntimeError('Unrecognized form: ' + form + '.')
+    return prob
+
+
+def _assemble_constrained_primal(prebuilt, X):
+    metadata = {'lagrangian': prebuilt['lagrangian'], 'X': X, 'modulator': prebuilt['modulator']}
+    # The Lagrangian (after possible multiplication by the modulator) must be a SAGE signomial.
+    lagrangian = prebuilt['modulated_lagrangian']
+    con = primal_sage_cone(lagrangian, name='Lagrangian is SAGE', X=X)
+    constrs = [con]
+    #  Lagrange multipliers (for inequality constraints) must be SAGE signomials.
+    expcovers = None
+    for i, (s_h, _) in enumerate(prebuilt['ineq_lag_mults']):
+        con_name = 'SAGE multiplier for signomial inequality # ' + str(i)
+        con = primal_sage_cone(s_h, name=con_name, X=X, expcovers=expcovers)
+        expcovers = con.ech.expcovers  # only * really * needed in first iteration, but keeps code flat.
+        constrs.append(con)
+    # Construct the coniclifts Problem.
+    prob = cl.Problem(cl.MAX, prebuilt['gamma'], constrs)
+    prob.metadata = metadata
+    return prob
+
+
+def _assemble_constrained_dual(prebuilt, X, slacks=False):
+    f, modulator = prebuilt['f'], prebuilt['modulator']
+    metadata = {'lagrangian': prebuilt['lagrangian'], 'f': f, 'gts': prebuilt['gts'], 'eqs': prebuilt['eqs'],
+                'level': prebuilt['level'], 'X': X, 'modulator': modulator}
+    lagrangian = prebuilt['modulated_lagrangian']
+    if prebuilt['level'][2] > 0:
+        f = f * modulator
     # In primal form, the Lagrangian is constrained to be a SAGE signomial.
     # Introduce a dual variable "v" for this constraint.
     v = cl.Variable(shape=(lagrangian.m, 1), name='v')
     con = relative_dual_sage_cone(lagrangian, v, name='Lagrangian SAGE dual constraint', X=X)
     constraints = [con]
     expcovers = None
-    for i, (s_h, h) in enumerate(ineq_lag_mults):
+    for i, (s_h, h) in enumerate(prebuilt['ineq_lag_mults']):
         # These generalized Lagrange multipliers "s_h" are SAGE signomials.
         # For each such multiplier, introduce an appropriate dual variable "v_h", along
         # with constraints over that dual variable.
@@ -352,7 +382,7 @@ def sig_constrained_dual(f, gts, eqs, p=0, q=1, ell=0, X=None, slacks=False):
         con = relative_dual_sage_cone(s_h, v_h, name=con_name, X=X, expcovers=expcovers)
         expcovers = con.ech.expcovers  # only * really * needed in first iteration, but keeps code flat.
         constraints.append(con)
-    for s_h, h in eq_lag_mults:
+    for s_h, h in prebuilt['eq_lag_mults']:
         # These generalized Lagrange multipliers "s_h" are arbitrary signomials.
         # They dualize to homogeneous equality constraints.
         h = h * modulator
@@ -367,7 +397,6 @@ def sig_constrained_dual(f, gts, eqs, p=0, q=1, ell=0, X=None, slacks=False):
     # Return the coniclifts Problem.
     prob = cl.Problem(cl.MIN, obj, constraints)
     prob.metadata = metadata
-    cl.clear_variable_indices()
     return prob
 
 
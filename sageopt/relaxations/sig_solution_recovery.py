@@ -119,20 +119,29 @@ def sig_solrec(prob, ineq_tol=1e-8, eq_tol=1e-6, skip_ls=False):
         sols0 = _least_squares_solution_recovery(alpha_reduced, con, v, M, gts, eqs, ineq_tol, eq_tol)
     sols1 = _dual_age_cone_solution_recovery(con, v, M, gts, eqs, ineq_tol, eq_tol)
     sols = sols0 + sols1
-    sols.sort(key=lambda mu: f(mu))
+    if len(sols) > 1:
+        # evaluate every candidate in one call, then sort by objective value.
+        vals = f(np.column_stack(sols))
+        sols = [sols[i] for i in np.argsort(vals, kind='stable')]
     return sols
 
 
 def _least_squares_solution_recovery(alpha_reduced, con, v, M, gts, eqs, ineq_tol, eq_tol):
     v_reduced = M @ v
     log_v_reduced = np.log(v_reduced + 1e-8)
+    try:
+        mu_ls = np.linalg.lstsq(alpha_reduced, log_v_reduced, rcond=None)[0]
+    except np.linalg.linalg.LinAlgError:
+        mu_ls = None
     if con.X is not None:
+        # If log_v_reduced is (numerically) in the range of alpha_reduced, then v_reduced is the
+        # moment vector of a point mass, and a feasible unconstrained least-squares solution
+        # is also optimal for the constrained problem. Only solve the latter if needed.
+        if mu_ls is not None and is_feasible(mu_ls, gts, eqs, ineq_tol, eq_tol):
+            residual = np.linalg.norm(alpha_reduced @ mu_ls - log_v_reduced)
+            if residual <= 1e-6 * max(1.0, np.linalg.norm(log_v_reduced)):
+                return [mu_ls]
         mu_ls = _constrained_least_squares(con, alpha_reduced, log_v_reduced)
-    else:
-        try:
-            mu_ls = np.linalg.lstsq(alpha_reduced, log_v_reduced, rcond=None)[0]
-        except np.linalg.linalg.LinAlgError:
-            mu_ls = None
     if mu_ls is not None and is_feasible(mu_ls, gts, eqs, ineq_tol, eq_tol):
         return [mu_ls]
     else:
@@ -47,10 +47,9 @@ def standard_sig_monomials(n):
 
     """
     y = np.empty(shape=(n,), dtype=object)
+    eye = np.eye(n)
     for i in range(n):
-        ei = np.zeros(shape=(1, n))
-        ei[0, i] = 1
-        y[i] = Signomial(ei, np.array([1]))
+        y[i] = Signomial(eye[i:i+1, :], np.array([1]))
     return y
 
 
@@ -135,7 +134,7 @@ class Signomial(object):
 
     def __init__(self, alpha, c):
         if isinstance(alpha, list):
-            alpha = np.ndarray(alpha)
+            alpha = np.array(alpha)
         if alpha.shape[0] != c.size:  # pragma: no cover
             raise ValueError('alpha and c specify different numbers of terms')
         if isinstance(c, np.ndarray) and not isinstance(c, cl.Expression) and c.dtype == object:
@@ -143,11 +142,13 @@ class Signomial(object):
         if isinstance(alpha, np.ndarray):
             alpha = np.round(alpha, decimals=__EXPONENT_VECTOR_DECIMAL_POINTS__)
             alpha, c = sym_util.consolidate_basis_funcs(alpha, c)
+            alpha = np.ascontiguousarray(alpha, dtype=np.float64)
         self._alpha = alpha
         self._c = c
         self._n = alpha.shape[1]
         self._m = alpha.shape[0]
         self._alpha_c = None
+        self._alpha_ld = None
         self._grad = None
         self._hess = None
         self.metadata = dict()
@@ -263,8 +264,8 @@ class Signomial(object):
         if not isinstance(alpha, np.ndarray):
             raise NotImplementedError()
         self._alpha_c = dict()
-        for j in range(c.size):
-            self._alpha_c[tuple(alpha[j, :])] = c[j]
+        for j, key in enumerate(sym_util.row_keys(alpha)):
+            self._alpha_c[key] = c[j]
 
     def __add__(self, other):
         try:
@@ -329,9 +330,16 @@ class Signomial(object):
                 # by using multinomial coefficients. Once this is done,
                 # add new tests for correctness of ``__pow__``, since it would
                 # no longer follow from correctness of ``__mul__``.
-                s = Signomial(self.alpha, self.c)
-                for t in range(power - 1):
-                    s = s * self
+                #
+                # Exponentiation by squaring: O(log(power)) calls to ``__mul__``.
+                s = None
+                base = Signomial(self.alpha, self.c)
+                while power > 0:
+                    if power & 1:
+                        s = base if s is None else s * base
+                    power >>= 1
+                    if power > 0:
+                        base = base * base
                 return s
         else:
             d = dict((k, v) for (k, v) in self.alpha_c.items() if v != 0)
@@ -373,9 +381,13 @@ class Signomial(object):
         if x.ndim > 2:
             msg = 'Signomials cannot be called on ndarrays with more than 2 dimensions.'
             raise ValueError(msg)
+        if self._alpha_ld is None:
+            # alpha never changes, so the extended-precision copy is made once.
+            self._alpha_ld = self.alpha.astype(np.longdouble)
+        # if x is 2-d, then all of its columns are evaluated with one matrix product.
         x = x.astype(np.longdouble)
-        exponents = np.dot(self.alpha.astype(np.longdouble), x)
-        linear_vars = np.exp(exponents).astype(np.longdouble)
+        exponents = np.dot(self._alpha_ld, x)
+        linear_vars = np.exp(exponents)
         val = np.dot(self.c, linear_vars)
         return val
 
@@ -562,13 +574,8 @@ class Signomial(object):
         -------
         s : Signomial
         """
-        alpha = []
-        c = []
-        for k, v in d.items():
-            alpha.append(k)
-            c.append(v)
-        alpha = np.array(alpha)
-        c = np.array(c)
+        alpha = np.array(list(d.keys()))
+        c = np.array(list(d.values()))
         s = Signomial(alpha, c)
         s._alpha_c = d
         return s
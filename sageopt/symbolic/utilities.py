@@ -32,18 +32,29 @@ class Labeler(object):
         return c
 
 
+def row_keys(mat):
+    """
+    Return a list of hashable keys for the rows of ``mat``. For numeric ndarrays, the keys
+    are tuples of Python floats, which are much cheaper to build and hash than tuples of
+    numpy scalars (while comparing and hashing equal to them).
+    """
+    if isinstance(mat, np.ndarray) and mat.dtype in __REAL_TYPES__:
+        return [tuple(r) for r in mat.tolist()]
+    return [tuple(r) for r in mat]
+
+
 def align_basis_matrices(mats):
     mat0 = mats[0]
     aligned_rows = [ri for ri in mat0]  # initial value
     lifting_locs = [[idx for idx in range(mat0.shape[0])]]
-    d0 = {tuple(ri): i for (i, ri) in enumerate(mat0)}
+    d0 = {key: i for (i, key) in enumerate(row_keys(mat0))}
     labeler = Labeler(mat0.shape[0])
     acd = defaultdict(labeler.next_label, d0)
     for mat in mats[1:]:
         curr_coeff_locs = []
-        for ri in mat:
+        for ri, key in zip(mat, row_keys(mat)):
             up_next = labeler.up_next
-            idx = acd[tuple(ri)]
+            idx = acd[key]
             curr_coeff_locs.append(idx)
             if idx == up_next:
                 aligned_rows.append(ri)
@@ -82,20 +93,14 @@ def consolidate_basis_funcs(alpha, c):
         # then all exponent vectors are unique
         return alpha, c
     m_reduced = alpha_reduced.shape[0]
-    reducer_cols = []
-    for i in range(m_reduced):
-        # this way of constructing "reducer_cols" is inefficient
-        idxs = np.nonzero(inv == i)[0]
-        reducer_cols.append(idxs)
     if isinstance(c, cl.Expression):
+        # group the indices of each duplicated exponent vector (in increasing order).
+        order = np.argsort(inv, kind='stable')
+        reducer_cols = np.split(order, np.cumsum(counts)[:-1])
         c_reduced = cl.Expression([sum(c[rc]) for rc in reducer_cols])
         # ^ should be much faster than the sparse-matrix multiply, used below.
     else:
-        reducer_cols = np.hstack(reducer_cols)
-        reducer_rows = np.repeat(np.arange(m_reduced), counts)
-        reducer_coeffs = np.ones(reducer_rows.size)
-        R = sp.csr_matrix((reducer_coeffs, (reducer_rows, reducer_cols)))
-        c_reduced = R @ c
+        c_reduced = np.bincount(inv, weights=c, minlength=m_reduced)
     return alpha_reduced, c_reduced
 
 
@@ -15,8 +15,10 @@
 """
 import unittest
 import numpy as np
+import scipy.sparse as sp
 from sageopt.coniclifts.base import Variable, Expression
 from sageopt.coniclifts.operators import affine as aff
+from sageopt.coniclifts.operators.precompiled import affine as comp_aff
 
 
 class TestAffineOperators(unittest.TestCase):
@@ -305,4 +307,19 @@ class TestAffineOperators(unittest.TestCase):
         temp = aff.triu(A)
         expr0 = aff.sum(temp)
         expr1 = aff.sum(np.triu(A_cl))
-        assert Expression.are_equivalent(expr0, expr1.value)
\ No newline at end of file
+        assert Expression.are_equivalent(expr0, expr1.value)
+
+    def test_precompiled_sparse_matvec(self):
+        mat1 = np.random.randn(6, 3).round(decimals=3)
+        mat2 = np.eye(6)[:, :4]
+        x = Variable(shape=(3,))
+        y = Variable(shape=(4,))
+        x.value = np.random.randn(3)
+        y.value = np.random.randn(4)
+        expect = mat1 @ x.value + mat2 @ y.value
+        for m2 in [mat2, sp.csr_matrix(mat2)]:
+            av, ar, ac, b = comp_aff.matvec_plus_matvec(mat1, x, m2, y)
+            ids = x.scalar_variable_ids + y.scalar_variable_ids
+            A = sp.coo_matrix((av, (ar, [ids.index(c) for c in ac])), shape=(6, 7)).toarray()
+            actual = A @ np.concatenate((x.value, y.value)) + b
+            assert np.allclose(actual, expect)
@@ -128,6 +128,56 @@ class TestConstraints(unittest.TestCase):
         level5 = np.sum(rel_entr(w5[drop5], np.exp(1) * c5[drop5])) - c5[5]
         assert level5 < 1e-6
 
+    def test_ordinary_sage_primal_3(self):
+        # A SAGE cone with a single term is the nonnegative orthant.
+        alpha = np.array([[1.0, 2.0]])
+        c = Variable(shape=(1,), name='c')
+        sage_constraint = sage_cones.PrimalSageCone(c, alpha, X=None, name='test')
+        c.value = np.array([-2.0])
+        viol = sage_constraint.violation(norm_ord=np.inf, rough=True)
+        assert abs(viol - 2.0) < 1e-10
+        c.value = np.array([3.0])
+        viol = sage_constraint.violation(norm_ord=np.inf, rough=True)
+        assert viol == 0
+
+    @staticmethod
+    def _check_primal_sage_compile(make_c, alpha, X=None, settings=None):
+        settings = dict() if settings is None else settings
+        con0 = sage_cones.PrimalSageCone(make_c('c0'), alpha, X=X, name='con0', settings=settings)
+        rebuild = con0.compile()
+        # a constraint with the same structure, over new variables.
+        con1 = sage_cones.PrimalSageCone(make_c('c1'), alpha, X=X, name='con1', settings=settings)
+        var_ids = [vid for v in con1.variables() for vid in v.scalar_variable_ids]
+        actual = rebuild(var_ids)
+        expect = con1.conic_form()
+        assert len(actual) == len(expect)
+        for (av0, ar0, ac0, b0, K0), (av1, ar1, ac1, b1, K1) in zip(actual, expect):
+            assert np.allclose(av0, av1)
+            assert np.array_equal(ar0, ar1)
+            assert ac0 == ac1
+            assert np.allclose(b0, b1)
+            assert K0 == K1
+
+    def test_ordinary_sage_primal_compile(self):
+        alpha = np.array([[0, 0], [1, 0], [0, 1], [1, 1], [2, 1]])
+        self._check_primal_sage_compile(lambda nm: Variable(shape=(5,), name=nm), alpha)
+        # kernel-basis AGE witnesses
+        self._check_primal_sage_compile(lambda nm: Variable(shape=(5,), name=nm), alpha,
+                                        settings={'kernel_basis': True})
+        # constant c; the conic form doesn't involve any variables of the constraint.
+        self._check_primal_sage_compile(lambda nm: Expression([1., 2., 3., 4., 5.]), alpha)
+        self._check_primal_sage_compile(lambda nm: Expression([1., 2., -3., 4., 5.]), alpha)
+
+    def test_conditional_sage_primal_compile(self):
+        n, m = 2, 6
+        x = Variable(shape=(n,), name='x')
+        cons = [1 >= vector2norm(x)]
+        gts = [lambda z: 1 - np.linalg.norm(z, 2)]
+        sigdom = SigDomain(n, coniclifts_cons=cons, gts=gts, eqs=[])
+        np.random.seed(0)
+        alpha = 10 * np.random.randn(m, n)
+        self._check_primal_sage_compile(lambda nm: Variable(shape=(m,), name=nm), alpha, X=sigdom)
+
     def test_ordinary_sage_dual_1(self):
         # generate a point which has positive distance from the dual SAGE cone
         n, m = 2, 6
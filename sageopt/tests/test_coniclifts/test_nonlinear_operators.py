@@ -19,6 +19,7 @@ from scipy.special import rel_entr
 from sageopt.coniclifts.base import Variable
 from sageopt.coniclifts.operators import affine
 from sageopt.coniclifts.operators.relent import relent
+from sageopt.coniclifts.operators.precompiled import relent as precompiled_relent
 from sageopt.coniclifts.operators.norms import vector2norm
 from sageopt.coniclifts.operators.abs import abs as cl_abs
 from sageopt.coniclifts.operators.pos import pos as cl_pos
@@ -81,6 +82,21 @@ class TestNonlinearOperators(unittest.TestCase):
         assert np.all(b == np.array([1., 0., 0., 0., 0., 0., 0.]))
         assert K == [Cone('+', 1), Cone('e', 3), Cone('e', 3)]
 
+    def test_precompiled_relent_broadcast(self):
+        # elementwise_relent broadcasts a single-element "x" against "y"; sum_relent does not.
+        x = Variable(shape=(1,), name='x')
+        y = Variable(shape=(3,), name='y')
+        z = Variable(shape=(3,), name='z')
+        A_vals, A_rows, A_cols, b, K = precompiled_relent.elementwise_relent(x, y, z)
+        assert K == [Cone('e', 3)] * 3
+        x_id = x.scalar_variable_ids[0]
+        x_rows = [r for r, c in zip(A_rows, A_cols) if c == x_id]
+        assert x_rows == [2, 5, 8]
+        with self.assertRaises(RuntimeError):
+            precompiled_relent.sum_relent(x, y, 0, z)
+        with self.assertRaises(RuntimeError):
+            precompiled_relent.elementwise_relent(y[:2], y, z)
+
     def test_vector2norm_1(self):
         x = Variable(shape=(3,), name='x')
         nrm = vector2norm(x)
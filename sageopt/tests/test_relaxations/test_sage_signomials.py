@@ -21,36 +21,103 @@ from sageopt.relaxations import sig_relaxation, sig_constrained_relaxation, sage
 from sageopt.relaxations import sig_solrec, infer_domain
 from sageopt.symbolic.signomials import Signomial, standard_sig_monomials
 
+_MOSEK_INSTALLED = cl.Mosek.is_installed()
 
-def primal_dual_vals(f, ell, X=None, solver='ECOS'):
-    # primal
-    prob = sig_relaxation(f, X, form='primal', ell=ell)
-    status, value = prob.solve(solver=solver, verbose=False)
-    prim = value
-    # dual
-    prob = sig_relaxation(f, X, form='dual', ell=ell)
-    status, value = prob.solve(solver=solver, verbose=False)
-    dual = value
-    return [prim, dual], prob
-
-
-def constrained_primal_dual_vals(f, gts, eqs, p, q, ell, X, solver='ECOS'):
-    # primal
-    prob = sig_constrained_relaxation(f, gts, eqs,
-                                      form='primal', p=p, q=q, ell=ell, X=X)
-    status, value = prob.solve(solver=solver, verbose=False)
-    prim = value
-    # dual
-    prob = sig_constrained_relaxation(f, gts, eqs,
-                                      form='dual', p=p, q=q, ell=ell, X=X)
-    status, value = prob.solve(solver=solver, verbose=False)
-    dual = value
-    return [prim, dual], prob
+
+def primal_dual_vals(f, ell, X=None, solver='ECOS', forms=('primal', 'dual'), reltol=None):
+    # Solve the requested relaxations (in order); return their values,
+    # and the last problem which was solved. If "reltol" is given, then
+    # ECOS runs with that (absolute, relative, and feasibility) tolerance.
+    tols = dict()
+    if reltol is not None and solver == 'ECOS':
+        tols = {'abstol': reltol, 'reltol': reltol, 'feastol': reltol}
+    vals = []
+    for form in forms:
+        prob = sig_relaxation(f, X, form=form, ell=ell)
+        status, value = prob.solve(solver=solver, verbose=False, **tols)
+        vals.append(value)
+    return vals, prob
+
+
+def constrained_primal_dual_vals(f, gts, eqs, p, q, ell, X, solver='ECOS', forms=('primal', 'dual')):
+    vals = []
+    for form in forms:
+        prob = sig_constrained_relaxation(f, gts, eqs,
+                                          form=form, p=p, q=q, ell=ell, X=X)
+        status, value = prob.solve(solver=solver, verbose=False)
+        vals.append(value)
+    return vals, prob
+
+
+def _read_only(data):
+    # problem data shared by every test in a class must not be modified by any one test.
+    arr = np.array(data)
+    arr.setflags(write=False)
+    return arr
 
 
 # noinspection SpellCheckingInspection
 class TestSAGERelaxations(unittest.TestCase):
 
+    _UNCON_1_ALPHA = _read_only([[0, 0],
+                                 [1, 0],
+                                 [0, 1],
+                                 [1, 1],
+                                 [0.5, 0],
+                                 [0, 0.5]])
+    _UNCON_1_C = _read_only([0, 3, 2, 1, -4, -2])
+
+    _UNCON_2_ALPHA = _read_only([[0, 0],
+                                 [1, 0],
+                                 [0, 1],
+                                 [1, 1],
+                                 [0.5, 1],
+                                 [1, 0.5]])
+    _UNCON_2_C = _read_only([0, 1, 1, 1.9, -2, -2])
+
+    _UNCON_5_ALPHA = _read_only([[0., 1.],
+                                 [0.21, 0.08],
+                                 [0.16, 0.54],
+                                 [0., 0.],
+                                 [1., 0.],
+                                 [0.3, 0.58]])
+    _UNCON_5_C = _read_only([1., -57.75, -40.37, 33.94, 67.29, 38.28])
+
+    _UNCON_6_ALPHA = _read_only([[0., 1.],
+                                 [0., 0.],
+                                 [0.52, 0.15],
+                                 [1., 0.],
+                                 [2., 2.],
+                                 [1.3, 1.38]])
+    _UNCON_6_C = _read_only([2.55, 0.31, -1.48, 0.85, 0.65, -1.73])
+
+    _CON_1_F_ALPHA = _read_only([[10.2, 0, 0],
+                                 [0, 9.8, 0],
+                                 [0, 0, 8.2],
+                                 [1.5089, 1.0981, 1.3419],
+                                 [1.0857, 1.9069, 1.6192],
+                                 [1.0459, 0.0492, 1.6245]])
+    _CON_1_F_C = _read_only([10, 10, 10, -14.6794, -7.8601, 8.7838])
+
+    _CON_1_G_ALPHA = _read_only([[10.2, 0, 0],
+                                 [0, 9.8, 0],
+                                 [0, 0, 8.2],
+                                 [1.0857, 1.9069, 1.6192],
+                                 [0, 0, 0]])
+    _CON_1_G_C = _read_only([-8, -8, -8, -6.4, 1])
+
+    _CON_2_G1_ALPHA = _read_only([[0, 0, 0],
+                                  [1, 0, 0],
+                                  [0, 1, 0],
+                                  [0, 0, 1],
+                                  [2, 0, 0],
+                                  [1, 1, 0],
+                                  [1, 0, 1],
+                                  [0, 2, 0],
+                                  [0, 1, 1],
+                                  [0, 0, 2]])
+    _CON_2_G1_C = _read_only([24, -20, 9, -13, 4, -4, 4, 2, -2, 2])
+
     def test_unconstrained_sage_1(self, presolve=False, compactdual=True, kernel_basis=False):
         # Background
         #
@@ -69,14 +136,7 @@ class TestSAGERelaxations(unittest.TestCase):
         cl.presolve_trivial_age_cones(presolve)
         cl.compact_sage_duals(compactdual)
         cl.kernel_basis_age_witnesses(kernel_basis)
-        alpha = np.array([[0, 0],
-                          [1, 0],
-                          [0, 1],
-                          [1, 1],
-                          [0.5, 0],
-                          [0, 0.5]])
-        c = np.array([0, 3, 2, 1, -4, -2])
-        s = Signomial(alpha, c)
+        s = Signomial(self._UNCON_1_ALPHA, self._UNCON_1_C)
         expected = [-1.83333, -1.746505595]
         pd0, _ = primal_dual_vals(s, 0)
         self.assertAlmostEqual(pd0[0], expected[0], 4)
@@ -110,14 +170,7 @@ class TestSAGERelaxations(unittest.TestCase):
         #
         #       (3) Recover a globally optimal solution at ell == 1.
         #
-        alpha = np.array([[0, 0],
-                          [1, 0],
-                          [0, 1],
-                          [1, 1],
-                          [0.5, 1],
-                          [1, 0.5]])
-        c = np.array([0, 1, 1, 1.9, -2, -2])
-        s = Signomial(alpha, c)
+        s = Signomial(self._UNCON_2_ALPHA, self._UNCON_2_C)
         expected = [-np.inf, -0.122211863]
         pd0, _ = primal_dual_vals(s, 0)
         assert pd0[0] == expected[0] and pd0[1] == expected[0]
@@ -125,6 +178,8 @@ class TestSAGERelaxations(unittest.TestCase):
         assert abs(pd1[0] - expected[1]) < 1e-5 and abs(pd1[1] - expected[1]) < 1e-5
         solns = sig_solrec(dual)
         assert s(solns[0]) < 1e-6 + dual.value
+        vals = s(np.column_stack(solns))
+        assert np.all(vals >= dual.value - 1e-6)
 
     def test_unconstrained_sage_3(self):
         # Background
@@ -153,7 +208,7 @@ class TestSAGERelaxations(unittest.TestCase):
         pd1, _ = primal_dual_vals(s, 1)
         assert pd1[0] == expected and pd1[1] == expected
 
-    def test_unconstrained_sage_4(self, presolve=False, compactdual=False, kernel_basis=False):
+    def _unconstrained_sage_4(self, ells, presolve=False, compactdual=False, kernel_basis=False):
         # Background
         #
         #       This example was constructed soley as a test case for sageopt.
@@ -170,6 +225,10 @@ class TestSAGERelaxations(unittest.TestCase):
         #
         #       It may not be obvious, but the signomial "s" is actually convex!
         #
+        #       Each level of the hierarchy is independent, so the default-settings case is
+        #       split into one test per value of ell (this lets parallel runners schedule them
+        #       separately).
+        #
         initial_presolve = sage_cones.SETTINGS['presolve_trivial_age_cones']
         initial_compactdual = sage_cones.SETTINGS['compact_dual']
         initial_kb = sage_cones.SETTINGS['kernel_basis']
@@ -178,23 +237,36 @@ class TestSAGERelaxations(unittest.TestCase):
         cl.kernel_basis_age_witnesses(kernel_basis)
         s = Signomial.from_dict({(3,): 1, (2,): -4, (1,): 7, (-1,): 1})
         expected = [3.464102, 4.60250026, 4.6217973]
-        pds = [primal_dual_vals(s, ell) for ell in range(3)]
-        for ell in range(3):
-            assert abs(pds[ell][0][0] - expected[ell]) < 1e-5
-            assert abs(pds[ell][0][1] - expected[ell]) < 1e-5
-        dual = sig_relaxation(s, form='dual', ell=3)
-        dual.solve(solver='ECOS', verbose=False)
-        optsols = sig_solrec(dual)
-        assert s(optsols[0]) < 1e-6 + dual.value
+        for ell in ells:
+            if ell < 3:
+                pd, _ = primal_dual_vals(s, ell)
+                assert abs(pd[0] - expected[ell]) < 1e-5
+                assert abs(pd[1] - expected[ell]) < 1e-5
+            else:
+                _, dual = primal_dual_vals(s, ell, forms=('dual',))
+                optsols = sig_solrec(dual)
+                assert s(optsols[0]) < 1e-6 + dual.value
         cl.presolve_trivial_age_cones(initial_presolve)
         cl.compact_sage_duals(initial_compactdual)
         cl.kernel_basis_age_witnesses(initial_kb)
 
+    def test_unconstrained_sage_4_ell0(self):
+        self._unconstrained_sage_4([0])
+
+    def test_unconstrained_sage_4_ell1(self):
+        self._unconstrained_sage_4([1])
+
+    def test_unconstrained_sage_4_ell2(self):
+        self._unconstrained_sage_4([2])
+
+    def test_unconstrained_sage_4_ell3(self):
+        self._unconstrained_sage_4([3])
+
     def test_unconstrained_sage_4a(self):
-        self.test_unconstrained_sage_4(True, False, False)
+        self._unconstrained_sage_4(range(4), True, False, False)
 
     def test_unconstrained_sage_4b(self):
-        self.test_unconstrained_sage_4(False, True, True)
+        self._unconstrained_sage_4(range(4), False, True, True)
 
     def test_unconstrained_sage_5(self):
         # Background
@@ -206,18 +278,11 @@ class TestSAGERelaxations(unittest.TestCase):
         #
         #       (1) check that primal / dual objectives are close to reference values, for ell \in {0, 1}.
         #
-        alpha = np.array([[0., 1.],
-                          [0.21, 0.08],
-                          [0.16, 0.54],
-                          [0., 0.],
-                          [1., 0.],
-                          [0.3, 0.58]])
-        c = np.array([1., -57.75, -40.37, 33.94, 67.29, 38.28])
-        s = Signomial(alpha, c)
+        s = Signomial(self._UNCON_5_ALPHA, self._UNCON_5_C)
         expected = [-24.054866, -21.31651]
-        pd0, _ = primal_dual_vals(s, 0)
+        pd0, _ = primal_dual_vals(s, 0, reltol=1e-7)
         assert abs(pd0[0] - expected[0]) < 1e-4 and abs(pd0[1] - expected[0]) < 1e-4
-        pd1, _ = primal_dual_vals(s, 1)
+        pd1, _ = primal_dual_vals(s, 1, reltol=1e-7)
         assert abs(pd1[0] - expected[1]) < 1e-4 and abs(pd1[1] - expected[1]) < 1e-4
 
     def test_unconstrained_sage_6(self):
@@ -230,18 +295,11 @@ class TestSAGERelaxations(unittest.TestCase):
         #
         #       (1) check that primal / dual objectives are close to reference values, for ell \in {0, 1}.
         #
-        alpha = np.array([[0., 1.],
-                         [0., 0.],
-                         [0.52, 0.15],
-                         [1., 0.],
-                         [2., 2.],
-                         [1.3, 1.38]])
-        c = np.array([2.55, 0.31, -1.48, 0.85, 0.65, -1.73])
-        s = Signomial(alpha, c)
+        s = Signomial(self._UNCON_6_ALPHA, self._UNCON_6_C)
         expected = [0.00354263, 0.13793126]
-        pd0, _ = primal_dual_vals(s, 0)
+        pd0, _ = primal_dual_vals(s, 0, reltol=1e-7)
         assert abs(pd0[0] - expected[0]) < 1e-6 and abs(pd0[1] - expected[0]) < 1e-6
-        pd1, _ = primal_dual_vals(s, 1)
+        pd1, _ = primal_dual_vals(s, 1, reltol=1e-7)
         assert abs(pd1[0] - expected[1]) < 1e-6 and abs(pd1[1] - expected[1]) < 1e-6
 
     def test_sage_multiplier_search(self):
@@ -285,16 +343,8 @@ class TestSAGERelaxations(unittest.TestCase):
         #       The problem is to minimize a nonconvex signomial, over a convex set defined by a single
         #       posynomial inequality.
         #
-        s0 = Signomial.from_dict({(10.2, 0, 0): 10, (0, 9.8, 0): 10, (0, 0, 8.2): 10})
-        s1 = Signomial.from_dict({(1.5089, 1.0981, 1.3419): -14.6794})
-        s2 = Signomial.from_dict({(1.0857, 1.9069, 1.6192): -7.8601})
-        s3 = Signomial.from_dict({(1.0459, 0.0492, 1.6245): 8.7838})
-        f = s0 + s1 + s2 + s3
-        g = Signomial.from_dict({(10.2, 0, 0): -8,
-                                 (0, 9.8, 0): -8,
-                                 (0, 0, 8.2): -8,
-                                 (1.0857, 1.9069, 1.6192): -6.4,
-                                 (0, 0, 0): 1})
+        f = Signomial(TestSAGERelaxations._CON_1_F_ALPHA, TestSAGERelaxations._CON_1_F_C)
+        g = Signomial(TestSAGERelaxations._CON_1_G_ALPHA, TestSAGERelaxations._CON_1_G_C)
         gs = [g]
         return f, gs
 
@@ -341,16 +391,7 @@ class TestSAGERelaxations(unittest.TestCase):
         #
         x = standard_sig_monomials(3)
         f = -2 * x[0] + x[1] - x[2]
-        g1 = Signomial.from_dict({(0, 0, 0): 24,
-                        (1, 0, 0): -20,
-                        (0, 1, 0): 9,
-                        (0, 0, 1): -13,
-                        (2, 0, 0): 4,
-                        (1, 1, 0): -4,
-                        (1, 0, 1): 4,
-                        (0, 2, 0): 2,
-                        (0, 1, 1): -2,
-                        (0, 0, 2): 2})
+        g1 = Signomial(self._CON_2_G1_ALPHA, self._CON_2_G1_C)
         g2 = 4 - x[0] - x[1] - x[2]
         g3 = 6 - 3*x[1] - x[2]
         g4 = 2 - x[0]
@@ -390,7 +431,7 @@ class TestSAGERelaxations(unittest.TestCase):
         assert abs(vals[1] - expect) <= 1e-3
         solutions = sig_solrec(prob)
         assert len(solutions) > 0
-        if cl.Mosek.is_installed():
+        if _MOSEK_INSTALLED:
             vals, prob = primal_dual_vals(f, 3, X, solver='MOSEK')
             expect = -147.6666
             assert abs(vals[0] - expect) <= 1e-3
@@ -423,12 +464,14 @@ class TestSAGERelaxations(unittest.TestCase):
         gts = [y[0] * y[3] ** -1 + y[1] ** -1 * y[3] ** -1 - 1,
                - y[0] ** -2 * y[2] ** -1 - y[1] * y[2] ** -1 + 1]
         gts = [-g for g in gts]
-        gts += [1 - y[0], y[0] - 0.1,
-                10 - y[1], y[1] - 5,
-                15 - y[2], y[2] - 8,
-                1 - y[3], y[3] - 0.01]
+        box = [1 - y[0], y[0] - 0.1,
+               10 - y[1], y[1] - 5,
+               15 - y[2], y[2] - 8,
+               1 - y[3], y[3] - 0.01]
         eqs = []
-        X = infer_domain(f, gts, eqs)
+        # The box constraints are linear in log-space, so they are represented in X
+        # (as a single polyhedral constraint); they don't need Lagrange multipliers.
+        X = infer_domain(f, gts + box, eqs)
         p, q, ell = 0, 1, 0
         vals, dual = constrained_primal_dual_vals(f, gts, eqs, p, q, ell, X)
         assert abs(vals[0] - vals[1]) < 1e-5
@@ -436,7 +479,7 @@ class TestSAGERelaxations(unittest.TestCase):
         solns = sig_solrec(dual, ineq_tol=0)
         assert f(solns[0]) < 1e-8 + dual.value
 
-    @unittest.skipUnless(cl.Mosek.is_installed(), 'ECOS takes too long for this problem.')
+    @unittest.skipUnless(_MOSEK_INSTALLED, 'ECOS takes too long for this problem.')
     def test_conditional_constrained_sage_2(self):
         # Background
         #
@@ -466,7 +509,7 @@ class TestSAGERelaxations(unittest.TestCase):
         solns = sig_solrec(dual, ineq_tol=1e-8)
         assert (f(solns[0]) - dual.value) / dual.value < 1e-2
 
-    @unittest.skipUnless(cl.Mosek.is_installed(), 'ECOS takes too long for this problem.')
+    @unittest.skipUnless(_MOSEK_INSTALLED, 'ECOS takes too long for this problem.')
     def test_conditional_constrained_sage_3(self):
         # Background
         #
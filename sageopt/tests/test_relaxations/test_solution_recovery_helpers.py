@@ -14,9 +14,13 @@
    limitations under the License.
 """
 import unittest
+from unittest import mock
 import numpy as np
 import sageopt as so
+from sageopt.relaxations import sig_solution_recovery
 from sageopt.relaxations.poly_solution_recovery import mod2linsolve, mod2rref
+from sageopt.relaxations.symbolic_correspondences import moment_reduction_array
+from sageopt.symbolic.signomials import Signomial
 
 
 # noinspection SpellCheckingInspection
@@ -60,3 +64,28 @@ class TestPolySolutionRecoveryHelpers(unittest.TestCase):
         assert np.allclose(y_actual, y_expect)
 
 
+class TestSigSolutionRecoveryHelpers(unittest.TestCase):
+
+    def test_least_squares_point_mass(self):
+        y = so.standard_sig_monomials(2)
+        f = y[0] ** 2 + y[1] ** 2 - y[0] * y[1] + 0.5 * y[0]
+        X = so.infer_domain(f, [1 - y[0], 1 - y[1]], [])
+        prob = so.sig_relaxation(f, X, form='dual', ell=0)
+        con = prob.constraints[0]
+        lagrangian = sig_solution_recovery._make_dummy_lagrangian(f, [], [])
+        dummy = Signomial(con.alpha, np.ones(shape=(con.alpha.shape[0],)))
+        M = moment_reduction_array(lagrangian, prob.metadata['modulator'], dummy)
+        # "v" is the moment vector of a point mass at x0, which belongs to X.
+        x0 = np.array([-0.5, -1.0])
+        v = np.exp(con.alpha @ x0)
+        alpha = lagrangian.alpha
+        with mock.patch.object(sig_solution_recovery, '_constrained_least_squares') as cls:
+            sols = sig_solution_recovery._least_squares_solution_recovery(alpha, con, v, M,
+                                                                          X.gts, X.eqs, 1e-8, 1e-6)
+            cls.assert_not_called()
+        assert len(sols) == 1
+        assert np.allclose(sols[0], x0, atol=1e-6)
+        assert sig_solution_recovery.is_feasible(sols[0], X.gts, X.eqs)
+        log_v = np.log(M @ v + 1e-8)
+        mu_cls = sig_solution_recovery._constrained_least_squares(con, alpha, log_v)
+        assert np.allclose(sols[0], mu_cls, atol=1e-6)
@@ -61,6 +61,11 @@ class TestSignomials(unittest.TestCase):
         z0 = x[0]**0.5
         z1 = Signomial.from_dict({(0.5, 0): 1})
         assert z0 == z1
+        w = x[0] - 2 * x[1] + 3
+        w_prod = w
+        for k in range(2, 8):
+            w_prod = w_prod * w
+            assert w ** k == w_prod
 
     # noinspection PyUnresolvedReferences
     def test_scalar_multiplication(self):
@@ -160,6 +165,14 @@ class TestSignomials(unittest.TestCase):
         assert s(zero) == 1 and abs(s(one) - np.exp(1)) < 1e-10
         zero_one = np.array([[0, 1]])
         assert np.allclose(s(zero_one), np.exp(zero_one), rtol=0, atol=1e-10)
+        s = Signomial.from_dict({(1, 0): 2, (0, 1): -1, (0.5, 0.5): 3})
+        X = np.random.randn(2, 5)
+        expect = [s(X[:, j]) for j in range(5)]
+        # batched evaluation uses the same (extended) precision as evaluation at one point.
+        assert np.all(s(X) == np.array(expect))
+        s = Signomial(np.zeros(shape=(0, 2)), np.zeros(shape=(0,)))
+        actual = s(X)
+        assert actual.shape == (5,) and np.all(actual == 0)
 
     def test_signomial_grad_val(self):
         f = Signomial.from_dict({(2,): 1, (0,): -1})